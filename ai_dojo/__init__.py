@@ -7,6 +7,7 @@ from . import (
     mlts,
     show,
     plot,
+    profiling,
 )
 
 import seaborn
@@ -4,8 +4,11 @@ import numpy
 import os
 import zipfile
 
+from .profiling import instrument
 
 
+
+@instrument
 def read_usa_temperature(data_path="../.assets/data/climate/usa-avg-temp-monthly.csv"):
 
     def fahrenheit_to_celsius(f):
@@ -27,6 +30,7 @@ def read_usa_temperature(data_path="../.assets/data/climate/usa-avg-temp-monthly
     return usa_temp
 
 
+@instrument
 def read_chicago_taxi_trips(data_path, freq="d"):
     taxi_data = pandas.read_csv(
         data_path,
@@ -37,6 +41,7 @@ def read_chicago_taxi_trips(data_path, freq="d"):
     taxi_trips.freq = freq
     return taxi_trips
 
+@instrument
 def read_chicago_taxi_trips_daily(data_path="../.assets/data/taxi/taxi_trips_daily.csv"):
     taxi_trips = pandas.read_csv(
         data_path,
@@ -48,6 +53,7 @@ def read_chicago_taxi_trips_daily(data_path="../.assets/data/taxi/taxi_trips_dai
     return taxi_trips
 
 
+@instrument
 def read_iris(data_path="../.assets/data/iris/iris.csv"):
     data = pandas.read_csv(
         data_path,
@@ -56,6 +62,7 @@ def read_iris(data_path="../.assets/data/iris/iris.csv"):
     return data
 
 
+@instrument
 def read_house_prices(
     data_path="../.assets/data/house/prices.csv",
     encode_ordinal=True,
@@ -191,11 +198,13 @@ def read_house_prices(
         )
     return data
 
+@instrument
 def read_titanic(data_path="../.assets/data/titanic/titanic.csv"):
     data = pandas.read_csv(data_path)
     return data
 
 
+@instrument
 def read_heartbeat(
     data_path="../.assets/data/Heartbeat 2",
     balance_classes=False
@@ -225,6 +234,7 @@ def read_heartbeat(
     return data, label
 
 
+@instrument
 def read_house_prices_seattle(
     data_path="../.assets/data/houses_seattle/kc_house_data.csv",
     descr_path="../.assets/data/houses_seattle/description.csv",
@@ -234,6 +244,7 @@ def read_house_prices_seattle(
     return data, data_descr
 
 
+@instrument
 def read_iliad(
     data_path="../.assets/data/iliad/iliad.txt"
 ):
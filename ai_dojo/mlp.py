@@ -2,10 +2,14 @@ import numpy
 import math
 from sklearn.metrics import mean_squared_error
 
+from .profiling import instrument
 
+
+@instrument
 def root_mean_squared_error(y_true, y_pred):
     return math.sqrt(mean_squared_error(y_true, y_pred))
 
 
+@instrument
 def mean_absolute_percentage_error(y_true, y_pred):
     return numpy.mean(numpy.abs((y_true - y_pred) / y_true)) * 100
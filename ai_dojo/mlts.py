@@ -0,0 +1,156 @@
+import time
+import numpy
+import pandas
+from concurrent.futures import ProcessPoolExecutor
+
+from .profiling import instrument
+
+
+def statistics_features(X):
+    """Mean, standard deviation, extrema, skewness and kurtosis of each row."""
+    mean = X.mean(axis=1)
+    centered = X - mean[:, None]
+    # multiplications instead of powers on the matrix, numpy's generic pow is much slower
+    centered_2 = centered * centered
+    variance = centered_2.mean(axis=1)
+    std = numpy.sqrt(variance)
+    # constant rows have no defined shape, report 0 instead of nan
+    nonconstant = std > 0
+    scale = numpy.where(nonconstant, std, 1.0)
+    return {
+        "mean": mean,
+        "std": std,
+        "min": X.min(axis=1),
+        "max": X.max(axis=1),
+        "skew": numpy.where(nonconstant, (centered_2 * centered).mean(axis=1) / scale ** 3, 0.0),
+        "kurtosis": numpy.where(nonconstant, (centered_2 * centered_2).mean(axis=1) / scale ** 4 - 3, 0.0),
+    }
+
+
+def quantile_features(X, quantiles=(0.1, 0.25, 0.5, 0.75, 0.9)):
+    """Quantiles of the values of each row."""
+    values = numpy.quantile(X, quantiles, axis=1)
+    return {f"quantile_{q}": row for q, row in zip(quantiles, values)}
+
+
+def fft_band_features(X, n_bands=8):
+    """Relative spectral energy of each row in n_bands equally wide frequency bands, excluding the DC component."""
+    power = numpy.abs(numpy.fft.rfft(X, axis=1)[:, 1:]) ** 2
+    if n_bands > power.shape[1]:
+        raise ValueError(
+            f"Cannot split {power.shape[1]} frequencies of series of length {X.shape[1]} into {n_bands} bands"
+        )
+    bounds = numpy.linspace(0, power.shape[1], n_bands + 1).astype(int)
+    band_energy = numpy.add.reduceat(power, bounds[:-1], axis=1)
+    total = band_energy.sum(axis=1, keepdims=True)
+    band_energy = band_energy / numpy.where(total > 0, total, 1.0)
+    return {f"fft_band_{i}": band_energy[:, i] for i in range(n_bands)}
+
+
+def autocorrelation_features(X, lags=(1, 2, 5, 10)):
+    """Autocorrelation of each row at the given lags."""
+    invalid = [lag for lag in lags if not 1 <= lag < X.shape[1]]
+    if invalid:
+        raise ValueError(f"Lags {invalid} are outside the range 1 to {X.shape[1] - 1} for series of length {X.shape[1]}")
+    centered = X - X.mean(axis=1, keepdims=True)
+    variance = (centered * centered).mean(axis=1)
+    variance = numpy.where(variance > 0, variance, 1.0)
+    return {
+        f"autocorrelation_{lag}": (centered[:, :-lag] * centered[:, lag:]).mean(axis=1) / variance
+        for lag in lags
+    }
+
+
+def peak_features(X):
+    """Number of local maxima of each row, and how many of them lie above the row mean."""
+    inner = X[:, 1:-1]
+    is_peak = (inner > X[:, :-2]) & (inner >= X[:, 2:])
+    return {
+        "peak_count": is_peak.sum(axis=1),
+        "peak_count_above_mean": (is_peak & (inner > X.mean(axis=1, keepdims=True))).sum(axis=1),
+    }
+
+
+feature_functions = {
+    "statistics": statistics_features,
+    "quantiles": quantile_features,
+    "fft_bands": fft_band_features,
+    "autocorrelation": autocorrelation_features,
+    "peaks": peak_features,
+}
+
+
+def _extract_block(X, features):
+    columns = {}
+    for name, params in features.items():
+        columns.update(feature_functions[name](X, **params))
+    return pandas.DataFrame(columns)
+
+
+@instrument
+def extract_features(X, features=None, block_size=10000, n_jobs=None):
+    """
+    Compute a set of features for each row of a matrix of fixed-length time series.
+
+    Args:
+    X (pd.DataFrame or np.ndarray): 2-D matrix with one series per row, e.g. the data
+        returned by `datasets.read_heartbeat`.
+    features (str, list or dict): Names of the feature groups to compute, see `feature_functions`.
+        A dict maps each name to keyword arguments of its feature function, e.g.
+        {"fft_bands": {"n_bands": 16}, "peaks": {}}. Default is all feature groups.
+    block_size (int): Number of rows processed at once, bounding the memory used for
+        intermediate arrays. Default is 10000.
+    n_jobs (int): Number of worker processes processing blocks in parallel. Default is None,
+        which processes all blocks in the current process.
+
+    Returns:
+    pd.DataFrame: One row of features per series, with the index of X if it is a DataFrame.
+
+    Example:
+        data, label = datasets.read_heartbeat()
+        features = mlts.extract_features(data, ["statistics", "fft_bands"])
+    """
+    if features is None:
+        features = list(feature_functions)
+    if isinstance(features, str):
+        features = [features]
+    if not isinstance(features, dict):
+        features = {name: {} for name in features}
+    unknown = set(features) - set(feature_functions)
+    if unknown:
+        raise ValueError(f"Unknown features {sorted(unknown)}, use any of {list(feature_functions)}")
+    index = X.index if isinstance(X, pandas.DataFrame) else None
+    X = numpy.asarray(X, dtype=float)
+    # an empty input still yields the feature columns
+    blocks = [X[start:start + block_size] for start in range(0, X.shape[0], block_size)] or [X]
+    if n_jobs is None or len(blocks) < 2:
+        results = [_extract_block(block, features) for block in blocks]
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            results = list(executor.map(_extract_block, blocks, [features] * len(blocks)))
+    result = pandas.concat(results, ignore_index=True)
+    if index is not None:
+        result.index = index
+    return result
+
+
+def benchmark_feature_extraction(n_rows=100000, n_columns=187, repeat=3, **kwargs):
+    """
+    Measure the throughput of `extract_features` on random data.
+
+    Args:
+    n_rows (int): Number of series. Default is 100000.
+    n_columns (int): Length of each series. Default is 187, the length of a heartbeat.
+    repeat (int): Number of timed runs, the fastest one is reported. Default is 3.
+    **kwargs: Passed on to `extract_features`.
+
+    Returns:
+    float: Rows processed per second.
+    """
+    X = numpy.random.default_rng(0).normal(size=(n_rows, n_columns))
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        extract_features(X, **kwargs)
+        timings.append(time.perf_counter() - start)
+    return n_rows / min(timings)
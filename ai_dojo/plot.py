@@ -1,5 +1,7 @@
 import numpy as np
 import matplotlib.pyplot as plt
+import matplotlib.dates as mdates
+import pandas
 from mpl_toolkits.mplot3d.art3d import Poly3DCollection
 from typing import List, Tuple
 
@@ -84,4 +86,193 @@ def model_size_comparison(model_sizes: List[Tuple[str, float]]) -> None:
 
     plt.show()
 
-# Example usage:
\ No newline at end of file
+
+def _index_values(index: pandas.Index) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Return the x values to plot for a pandas index, and the same values as floats in
+    matplotlib's axis units. Periods are plotted at their start, timezone-aware
+    timestamps in UTC.
+    """
+    if isinstance(index, pandas.PeriodIndex):
+        index = index.to_timestamp()
+    if isinstance(index, pandas.DatetimeIndex):
+        if index.tz is not None:
+            index = index.tz_convert(None)
+        x = index.to_numpy()
+        return x, mdates.date2num(x)
+    if not pandas.api.types.is_numeric_dtype(index):
+        raise TypeError(f"The index must be datetime, period or numeric, got {index.dtype}")
+    x = index.to_numpy()
+    return x, x.astype(float)
+
+
+def _bucket_bounds(start: int, stop: int, n_buckets: int) -> np.ndarray:
+    """Split the index range [start, stop) into n_buckets contiguous, nearly equal buckets."""
+    return np.linspace(start, stop, n_buckets + 1).astype(int)
+
+
+def _argmax_per_bucket(values: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """Return the position of the first maximum within each bucket of a flat array."""
+    lengths = np.diff(np.append(starts, len(values)))
+    bucket_id = np.repeat(np.arange(len(starts)), lengths)
+    is_max = values == np.maximum.reduceat(values, starts)[bucket_id]
+    candidates = np.flatnonzero(is_max)
+    _, first = np.unique(bucket_id[candidates], return_index=True)
+    return candidates[first]
+
+
+def _lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Select indices of a shape-preserving subsample using Largest-Triangle-Three-Buckets.
+
+    Args:
+        x: Sorted numeric x values.
+        y: y values of the same length, without NaN.
+        n_out: Number of points to keep, including the first and the last point.
+
+    Returns:
+        np.ndarray: Sorted indices into x and y.
+
+    Description:
+        The inner points are split into n_out - 2 buckets. From each bucket the point
+        forming the largest triangle with the means of the previous and the next bucket
+        is kept. Anchoring on the previous bucket's mean instead of its selected point
+        removes the sequential dependency, so all buckets are processed in one pass of
+        whole-array NumPy operations.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    bounds = _bucket_bounds(1, n - 1, n_out - 2)
+    starts = bounds[:-1]
+    counts = np.diff(bounds)
+    mean_x = np.add.reduceat(x[1:n - 1], starts - 1) / counts
+    mean_y = np.add.reduceat(y[1:n - 1], starts - 1) / counts
+    # anchors: first point, bucket means, last point
+    anchor_x = np.concatenate([[x[0]], mean_x, [x[-1]]])
+    anchor_y = np.concatenate([[y[0]], mean_y, [y[-1]]])
+    bucket_id = np.repeat(np.arange(n_out - 2), counts)
+    ax_, ay_ = anchor_x[bucket_id], anchor_y[bucket_id]
+    cx_, cy_ = anchor_x[bucket_id + 2], anchor_y[bucket_id + 2]
+    bx_, by_ = x[1:n - 1], y[1:n - 1]
+    # twice the triangle area, the constant factor does not change the argmax
+    area = np.abs((ax_ - cx_) * (by_ - ay_) - (ax_ - bx_) * (cy_ - ay_))
+    selected = _argmax_per_bucket(area, starts - 1) + 1
+    return np.concatenate([[0], selected, [n - 1]])
+
+
+def _minmax(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Select indices of a subsample keeping the minimum and maximum of each bucket.
+
+    Args:
+        x: Sorted numeric x values.
+        y: y values of the same length, without NaN.
+        n_out: Upper bound on the number of points to keep.
+
+    Returns:
+        np.ndarray: Sorted, unique indices into x and y.
+    """
+    n = len(x)
+    n_buckets = n_out // 2
+    if n_out >= n or n_buckets < 1:
+        return np.arange(n)
+    starts = _bucket_bounds(0, n, n_buckets)[:-1]
+    y = np.asarray(y, dtype=float)
+    i_max = _argmax_per_bucket(y, starts)
+    i_min = _argmax_per_bucket(-y, starts)
+    return np.unique(np.concatenate([i_min, i_max]))
+
+
+_downsamplers = {
+    "lttb": _lttb,
+    "minmax": _minmax,
+}
+
+
+def time_series(data, ax=None, max_points=None, method="lttb", **kwargs):
+    """
+    Plot a long time series with the number of drawn points bounded by the axes width.
+
+    Args:
+        data: pandas.Series or pandas.DataFrame
+            Values indexed by time (or any sorted numeric index). Each column of a
+            DataFrame is drawn as a separate line.
+        ax: matplotlib.axes.Axes, optional
+            Axes to draw on. Defaults to the current axes.
+        max_points: int, optional
+            Maximum number of points per line. Defaults to the axes width in pixels.
+        method: str
+            Downsampling algorithm, either "lttb" or "minmax".
+        label: str or list of str, optional
+            Legend label of a single-column input, or one label per column.
+            Defaults to the column names, or the name of a Series.
+        **kwargs:
+            Passed on to `Axes.plot`.
+
+    Returns:
+        matplotlib.axes.Axes: The axes containing the plot.
+
+    Description:
+        Lines are colored with the project palette. Whenever the x limits change, e.g.
+        when zooming or panning in an interactive backend, the visible range is
+        downsampled again from the full data, so detail appears as you zoom in.
+    """
+    from . import palette
+
+    if method not in _downsamplers:
+        raise ValueError(f"Unknown downsampling method {method!r}, use one of {list(_downsamplers)}")
+    downsample = _downsamplers[method]
+    if ax is None:
+        ax = plt.gca()
+    # an unnamed series gets no legend entry rather than the column name 0
+    default_labels = None
+    if isinstance(data, pandas.Series):
+        default_labels = [data.name]
+        data = data.to_frame()
+
+    def point_budget():
+        if max_points is not None:
+            return max_points
+        return max(int(ax.get_window_extent().width), 3)
+
+    color = kwargs.pop("color", None)
+    label = kwargs.pop("label", None)
+    lines = []
+    if label is None:
+        labels = default_labels or list(data.columns)
+    elif isinstance(label, str):
+        if len(data.columns) != 1:
+            raise ValueError("A single label requires single-column data, pass a list of labels instead")
+        labels = [label]
+    else:
+        labels = list(label)
+        if len(labels) != len(data.columns):
+            raise ValueError(f"Got {len(labels)} labels for {len(data.columns)} columns")
+    x, x_num = _index_values(data.index)
+    for i, (column, column_label) in enumerate(zip(data.columns, labels)):
+        y = data[column].to_numpy(dtype=float)
+        valid = ~np.isnan(y)
+        line_x, line_x_num, line_y = x[valid], x_num[valid], y[valid]
+        idx = downsample(line_x_num, line_y, point_budget())
+        line, = ax.plot(
+            line_x[idx],
+            line_y[idx],
+            color=color or palette[i % len(palette)],
+            label=column_label,
+            **kwargs,
+        )
+        lines.append((line, line_x, line_x_num, line_y))
+
+    def on_xlim_changed(ax):
+        low, high = ax.get_xlim()
+        for line, line_x, line_x_num, line_y in lines:
+            # include one point beyond each edge so the line runs to the border
+            start = max(np.searchsorted(line_x_num, low) - 1, 0)
+            stop = min(np.searchsorted(line_x_num, high) + 1, len(line_x_num))
+            idx = start + downsample(line_x_num[start:stop], line_y[start:stop], point_budget())
+            line.set_data(line_x[idx], line_y[idx])
+        ax.figure.canvas.draw_idle()
+
+    ax.callbacks.connect("xlim_changed", on_xlim_changed)
+    return ax
@@ -0,0 +1,264 @@
+import os
+import time
+import timeit
+import threading
+import functools
+import tracemalloc
+import contextlib
+import pandas
+
+
+_enabled = False
+_trace_memory = False
+_owns_tracing = False
+_active_memory_calls = 0
+_stats = {}
+_lock = threading.Lock()
+_depth = threading.local()
+_own_reads = threading.local()
+
+
+try:
+    _io_fd = os.open("/proc/self/io", os.O_RDONLY)
+except (OSError, AttributeError):
+    _io_fd = None
+
+
+def _chars_read():
+    """
+    Return the number of characters this process has read so far (rchar in /proc/self/io),
+    or None if the platform does not report it, together with the characters this thread
+    has read through this function before. The difference of the latter between two calls
+    is the bias the reads of /proc/self/io add to the difference of the former.
+    """
+    own_reads = getattr(_own_reads, "value", 0)
+    if _io_fd is None:
+        return None, own_reads
+    try:
+        content = os.pread(_io_fd, 512, 0)
+    except OSError:
+        return None, own_reads
+    _own_reads.value = own_reads + len(content)
+    for line in content.split(b"\n"):
+        if line.startswith(b"rchar:"):
+            return int(line.split()[1]), own_reads
+    return None, own_reads
+
+
+def _record(name, wall_time, cpu_time, peak_memory, chars_read):
+    with _lock:
+        entry = _stats.setdefault(
+            name,
+            {
+                "calls": 0,
+                "wall_time": 0.0,
+                "cpu_time": 0.0,
+                "peak_memory": None,
+                "chars_read": None,
+            },
+        )
+        entry["calls"] += 1
+        entry["wall_time"] += wall_time
+        entry["cpu_time"] += cpu_time
+        if peak_memory is not None:
+            entry["peak_memory"] = max(entry["peak_memory"] or 0, peak_memory)
+        if chars_read is not None:
+            entry["chars_read"] = (entry["chars_read"] or 0) + chars_read
+
+
+def _memory_call_started():
+    """Register an outermost call for memory tracking and return the traced memory at its start."""
+    global _active_memory_calls
+    with _lock:
+        if not (_owns_tracing and tracemalloc.is_tracing()):
+            return None
+        # only reset the shared peak when no other thread is measuring a call
+        if _active_memory_calls == 0:
+            tracemalloc.reset_peak()
+        _active_memory_calls += 1
+        return tracemalloc.get_traced_memory()[0]
+
+
+def _memory_call_finished(memory_before):
+    """Unregister an outermost call and return its peak memory above the start, or None."""
+    global _active_memory_calls
+    with _lock:
+        _active_memory_calls -= 1
+        if not tracemalloc.is_tracing():
+            return None
+        return max(tracemalloc.get_traced_memory()[1] - memory_before, 0)
+
+
+def instrument(func):
+    """
+    Decorator recording wall time, CPU time, peak memory and characters read for each call of func.
+
+    Nothing is recorded unless profiling is enabled, either by setting the environment
+    variable AI_DOJO_PROFILE=1 before import, via `enable()`, or inside a `profile()` block.
+    Peak memory is only recorded if memory tracing was requested as well, with
+    AI_DOJO_PROFILE=memory, `enable(memory=True)` or `profile(memory=True)`.
+    """
+    name = f"{func.__module__}.{func.__qualname__}"
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _enabled:
+            return func(*args, **kwargs)
+        depth = getattr(_depth, "value", 0)
+        memory_before = None
+        if depth == 0 and _trace_memory:
+            memory_before = _memory_call_started()
+        read_before, own_reads_before = _chars_read()
+        cpu_before = time.process_time()
+        wall_before = time.perf_counter()
+        _depth.value = depth + 1
+        try:
+            return func(*args, **kwargs)
+        finally:
+            wall_time = time.perf_counter() - wall_before
+            cpu_time = time.process_time() - cpu_before
+            _depth.value = depth
+            read_after, own_reads_after = _chars_read()
+            peak_memory = None
+            if memory_before is not None:
+                peak_memory = _memory_call_finished(memory_before)
+            chars_read = None
+            if read_before is not None and read_after is not None:
+                chars_read = (read_after - read_before) - (own_reads_after - own_reads_before)
+            _record(name, wall_time, cpu_time, peak_memory, chars_read)
+
+    return wrapper
+
+
+def enable(memory=False):
+    """
+    Start recording calls of instrumented functions.
+
+    Args:
+    memory (bool): Also record the peak memory of each call with tracemalloc. Tracing stays
+        on until `disable()`, and slows down Python allocations considerably, so wall and CPU
+        times are inflated while it is on. Peak memory is only recorded if tracemalloc is not
+        already in use by someone else, and concurrent calls in other threads share the peak.
+        Default is False.
+    """
+    global _enabled, _trace_memory, _owns_tracing
+    with _lock:
+        _enabled = True
+        _trace_memory = memory
+        if memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _owns_tracing = True
+        elif not memory and _owns_tracing:
+            tracemalloc.stop()
+            _owns_tracing = False
+
+
+def disable():
+    """Stop recording calls of instrumented functions, and stop memory tracing started by `enable()`."""
+    global _enabled, _trace_memory, _owns_tracing
+    with _lock:
+        _enabled = False
+        _trace_memory = False
+        if _owns_tracing:
+            tracemalloc.stop()
+            _owns_tracing = False
+
+
+@contextlib.contextmanager
+def profile(reset_stats=False, memory=False):
+    """
+    Context manager enabling profiling for the enclosed block.
+
+    Args:
+    reset_stats (bool): Discard previously recorded stats on entry. Default is False.
+    memory (bool): Also record peak memory, which inflates times, see `enable()`. Default is False.
+
+    Example:
+        with profiling.profile():
+            data, label = datasets.read_heartbeat()
+        profiling.report()
+    """
+    if reset_stats:
+        reset()
+    previous = (_enabled, _trace_memory)
+    enable(memory=memory)
+    try:
+        yield
+    finally:
+        if previous[0]:
+            enable(memory=previous[1])
+        else:
+            disable()
+
+
+def reset():
+    """Discard all recorded stats."""
+    with _lock:
+        _stats.clear()
+
+
+def stats():
+    """
+    Return the aggregated stats of all recorded calls.
+
+    Returns:
+    pandas.DataFrame: One row per instrumented function, sorted by total wall time, with
+        the number of calls, total wall and CPU time in seconds, the largest peak memory
+        of a single call in bytes and the total characters read. The latter is the
+        process-wide rchar counter, which includes reads by other threads (e.g. a Jupyter
+        kernel's sockets) and from the page cache, not just what the function read from disk.
+    """
+    with _lock:
+        records = {name: dict(entry) for name, entry in _stats.items()}
+    columns = ["calls", "wall_time", "cpu_time", "peak_memory", "chars_read"]
+    table = pandas.DataFrame.from_dict(records, orient="index", columns=columns)
+    table.index.name = "function"
+    return table.sort_values("wall_time", ascending=False)
+
+
+def report():
+    """Display the aggregated stats as a table in the notebook output."""
+    from IPython.display import display
+    table = stats()
+    table["wall_time_per_call"] = table["wall_time"] / table["calls"]
+    display(
+        table.style.format(
+            {
+                "wall_time": "{:.3f} s",
+                "cpu_time": "{:.3f} s",
+                "wall_time_per_call": "{:.3f} s",
+                "peak_memory": lambda b: "" if pandas.isna(b) else f"{b / 2**20:.1f} MiB",
+                "chars_read": lambda b: "" if pandas.isna(b) else f"{b / 2**20:.1f} MiB",
+            }
+        )
+    )
+
+
+def measure_overhead(number=1000000):
+    """
+    Measure the cost an instrumented function adds per call while profiling is disabled.
+
+    Args:
+    number (int): Number of calls to time. Default is 1000000.
+
+    Returns:
+    float: Additional time per call in seconds, compared to calling the function directly.
+    """
+    def noop():
+        pass
+
+    wrapped = instrument(noop)
+    previous = (_enabled, _trace_memory)
+    disable()
+    try:
+        direct = min(timeit.repeat(noop, number=number, repeat=5))
+        instrumented = min(timeit.repeat(wrapped, number=number, repeat=5))
+    finally:
+        if previous[0]:
+            enable(memory=previous[1])
+    return (instrumented - direct) / number
+
+
+_mode = os.environ.get("AI_DOJO_PROFILE", "").lower()
+if _mode in ("1", "true", "yes", "on", "memory"):
+    enable(memory=_mode == "memory")
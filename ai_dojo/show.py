@@ -5,7 +5,10 @@ import re
 import numpy as np
 import pandas
 
+from .profiling import instrument
 
+
+@instrument
 def command(cmd):
     """
     Display a terminal command with an HTML layout, including a "Copy" button with a clipboard symbol.
@@ -35,6 +38,7 @@ def command(cmd):
     """
     return HTML(html_content)
 
+@instrument
 def text(text: str, limit: int = 1000):
     """Display text in an output cell formatted with Markdown, limited to a specified number of characters.
 
@@ -47,6 +51,7 @@ def text(text: str, limit: int = 1000):
     # Display the text as Markdown
     display(Markdown(limited_text))
 
+@instrument
 def image(image_path: str, caption: str = None):
     """Display an image with an optional caption formatted with IPython.display tools.
 
@@ -62,6 +67,7 @@ def image(image_path: str, caption: str = None):
         display(Markdown(f'{caption}'))
 
 
+@instrument
 def stream(stream):
     """
     Show the streaming response of language models.
@@ -74,6 +80,7 @@ def stream(stream):
         print(chunk['message']['content'], end='', flush=True)
 
 
+@instrument
 def github_repo(repo_url, github_token=None):
     """
     Display a preview of a GitHub repository in a Jupyter Notebook.
@@ -156,6 +163,7 @@ def github_repo(repo_url, github_token=None):
         display(HTML(html_content))
 
 
+@instrument
 def huggingface_model(model_url):
     """
     Display a preview of a Hugging Face model in a Jupyter Notebook.
@@ -224,6 +232,7 @@ def huggingface_model(model_url):
 
 
 
+@instrument
 def audio(waveform, sample_rate):
     # Ensure waveform is a numpy array
     waveform = waveform.numpy()
@@ -240,6 +249,7 @@ def audio(waveform, sample_rate):
     return Audio(waveform_int16, rate=sample_rate)
 
 
+@instrument
 def dataframe_with_text(df, max_colwidth=400, max_chars=500):
     """
     This function displays a DataFrame with specified settings for text wrapping, column width,